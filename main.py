@@ -14,17 +14,26 @@ Example:
 
 import os
 import sys
+import hashlib
+import shutil
+import zipfile
 import re
 import argparse
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 from urllib.parse import urljoin, urlparse
 import time
 import requests
-from bs4 import BeautifulSoup
-from PIL import Image
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from lxml import etree, html
+from reportlab import rl_config
 from reportlab.lib.pagesizes import letter
 from reportlab.platypus import SimpleDocTemplate, Image as RLImage, PageBreak
 from reportlab.lib.utils import ImageReader
+import ebooklib
 from ebooklib import epub
 import base64
 from io import BytesIO
@@ -36,39 +45,97 @@ from rich import print as rprint
 
 console = Console()
 
+# Write image streams as raw binary. ReportLab's default ASCII85 wrapping is done in
+# pure Python over every byte of every page and makes the PDF ~25% larger.
+rl_config.useA85 = 0
+
+# Page selectors are compiled once and evaluated by libxml2
+_READING_CONTENT_XPATH = etree.XPath('//div[contains(concat(" ", normalize-space(@class), " "), " reading-content ")]')
+_IMG_XPATH = etree.XPath('.//img')
+_SELECTBOX_XPATH = etree.XPath('//*[contains(concat(" ", normalize-space(@class), " "), " chapters_selectbox_holder ")]')
+_SELECTED_OPTION_XPATH = etree.XPath('.//option[@selected]')
+_OPTION_XPATH = etree.XPath('.//option')
+_H1_XPATH = etree.XPath('//h1')
+_TITLE_XPATH = etree.XPath('//title')
+
+_ISSUE_NUMBER_RE = re.compile(r'-(\d+)/?$')
+_ISSUE_SUFFIX_RE = re.compile(r'#?\d+.*$')
+_WHITESPACE_RE = re.compile(r'\s+')
+_UNSAFE_CHARS_RE = re.compile(r'[^\w\s-]')
+_SEPARATORS_RE = re.compile(r'[-\s]+')
+
+_IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.gif', '.webp'}
+
+class RateLimiter:
+    """Token bucket that caps the request rate across all download threads."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.last = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until the caller is allowed to make a request."""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            # Reserve a token; a negative balance is the queue of waiting threads
+            self.tokens -= 1
+            wait_time = -self.tokens / self.rate if self.tokens < 0 else 0
+        
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+
 class ComicCompiler:
-    def __init__(self, output_dir: str):
+    def __init__(self, output_dir: str, max_workers: int = 8, requests_per_second: float = 2.0):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.max_workers = max_workers
+        # The burst stays small and independent of max_workers so an idle stretch (a build,
+        # a page fetch) never lets a whole pool's worth of requests hit the host at once
+        self.rate_limiter = RateLimiter(requests_per_second, burst=2)
+        # Already downloaded images, by URL and by content hash
+        self.seen_urls: dict[str, Path] = {}
+        self.seen_hashes: dict[bytes, Path] = {}
+        self.seen_lock = threading.Lock()
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
+        # Connection errors, timeouts and 429/5xx responses are retried with exponential
+        # backoff, honouring Retry-After when the server sends one
+        retry = Retry(total=3, backoff_factor=1, status_forcelist=(429, 500, 502, 503, 504),
+                      allowed_methods=('GET', 'HEAD'), respect_retry_after_header=True)
+        # pool_maxsize is the number of keep-alive connections kept per host: one per download
+        # thread plus one for the page prefetcher. (pool_connections is the number of per-host
+        # pools cached, not threads, so the default is left alone.) pool_block makes a thread
+        # wait for a pooled connection rather than opening (and then discarding) an extra one,
+        # which would cost a fresh TLS handshake.
+        adapter = HTTPAdapter(max_retries=retry, pool_maxsize=max_workers + 1, pool_block=True)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
     
-    def extract_comic_title(self, url: str) -> str:
-        """Extract comic title from the chapters_selectbox_holder or page title."""
+    def extract_comic_title(self, tree: html.HtmlElement, url: str) -> str:
+        """Extract comic title from the chapters_selectbox_holder or page title of an already parsed page."""
         try:
-            response = self.session.get(url)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
             # Try to find the title in chapters_selectbox_holder
-            selectbox = soup.find(class_='chapters_selectbox_holder')
+            selectbox = _SELECTBOX_XPATH(tree)
             if selectbox:
                 # Look for selected option or first option
-                selected = selectbox.find('option', {'selected': True})
-                if selected:
-                    return selected.get_text().strip()
-                first_option = selectbox.find('option')
-                if first_option:
-                    return first_option.get_text().strip()
+                options = _SELECTED_OPTION_XPATH(selectbox[0]) or _OPTION_XPATH(selectbox[0])
+                if options:
+                    return options[0].text_content().strip()
             
             # Fallback to page title or h1
-            title_tag = soup.find('h1') or soup.find('title')
-            if title_tag:
-                title = title_tag.get_text().strip()
+            title_tags = _H1_XPATH(tree) or _TITLE_XPATH(tree)
+            if title_tags:
+                title = title_tags[0].text_content().strip()
                 # Clean up the title
-                title = re.sub(r'\s+', ' ', title)
+                title = _WHITESPACE_RE.sub(' ', title)
                 return title
                 
             # Last resort - extract from URL
@@ -85,22 +152,23 @@ class ComicCompiler:
         """Extract all images from the reading-content div and return title and image URLs."""
         try:
             console.print(f"[blue]Fetching page: {url}[/blue]")
+            self.rate_limiter.acquire()
             response = self.session.get(url)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            tree = html.fromstring(response.content)
             
-            # Extract title
-            title = self.extract_comic_title(url)
+            # Extract title from the same parsed page
+            title = self.extract_comic_title(tree, url)
             
             # Find the reading-content div
-            reading_content = soup.find('div', class_='reading-content')
+            reading_content = _READING_CONTENT_XPATH(tree)
             if not reading_content:
                 console.print(f"[red]No reading-content div found on {url}[/red]")
                 return title, []
             
             # Find all images in the reading content
-            images = reading_content.find_all('img')
+            images = _IMG_XPATH(reading_content[0])
             image_urls = []
             
             for img in images:
@@ -118,298 +186,101 @@ class ComicCompiler:
             console.print(f"[red]Error fetching {url}: {e}[/red]")
             return "Unknown Comic", []
     
-    def download_image(self, url: str, filepath: Path, max_retries: int = 3) -> bool:
-        """Download an image from URL to filepath with retry logic."""
-        for attempt in range(max_retries):
+    def fetch_issue_pages(self, urls: list[str]):
+        """Yield get_comic_images() results in order, fetching the next page in the background."""
+        with ThreadPoolExecutor(max_workers=1) as page_fetcher:
+            pending = None
+            for url in urls:
+                future = page_fetcher.submit(self.get_comic_images, url)
+                if pending:
+                    yield pending.result()
+                pending = future
+            if pending:
+                yield pending.result()
+    
+    def link_existing_image(self, source: Path, filepath: Path) -> bool:
+        """Hard-link filepath to an already downloaded copy of the same image."""
+        link_path = filepath.with_name(filepath.name + '.link')
+        try:
+            os.link(source, link_path)
+            os.replace(link_path, filepath)
+            return True
+        except OSError:
+            # Source gone or filesystem without hard links; keep/download a real copy
+            return False
+    
+    def download_image(self, url: str, filepath: Path) -> bool:
+        """Download an image from URL to filepath; the session adapter retries failed requests, a cut-off body is retried once here."""
+        # Pages kept from an earlier run whose build failed are reused as-is. Downloads only
+        # ever land via os.replace of a finished .part file, so an existing page is complete.
+        try:
+            if filepath.stat().st_size > 0:
+                with self.seen_lock:
+                    self.seen_urls.setdefault(url, filepath)
+                return True
+        except FileNotFoundError:
+            pass
+
+        # Images reused across issues (banners, credits pages) are only fetched once
+        with self.seen_lock:
+            seen_path = self.seen_urls.get(url)
+        if seen_path and self.link_existing_image(seen_path, filepath):
+            return True
+        
+        # Stream into a .part file and only move it into place once the whole body
+        # has arrived, so a cut-off download never leaves a truncated page behind
+        part_path = filepath.with_suffix(filepath.suffix + '.part')
+        for attempt in range(2):
+            body_started = False
             try:
-                response = self.session.get(url, timeout=30)
-                response.raise_for_status()
+                self.rate_limiter.acquire()
+                response = self.session.get(url, timeout=30, stream=True)
                 
-                with open(filepath, 'wb') as f:
-                    f.write(response.content)
-                
-                return True
+                # Stream straight to disk instead of holding the whole image in memory.
+                # The 1 MiB file buffer batches chunks so most images land in one write() call.
+                digest = hashlib.blake2b(digest_size=16)
+                with response:
+                    response.raise_for_status()
+                    body_started = True
+                    with open(part_path, 'wb', buffering=1024 * 1024) as f:
+                        for chunk in response.iter_content(chunk_size=64 * 1024):
+                            digest.update(chunk)
+                            f.write(chunk)
+                os.replace(part_path, filepath)
+                break
                 
-            except (requests.exceptions.ConnectionError, 
+            except (requests.exceptions.ConnectionError,
                     requests.exceptions.Timeout,
                     requests.exceptions.ChunkedEncodingError) as e:
-                # These are retryable errors
-                if attempt < max_retries - 1:
-                    wait_time = (2 ** attempt)  # Exponential backoff: 1s, 2s, 4s
-                    console.print(f"[yellow]Download failed (attempt {attempt + 1}/{max_retries}), retrying in {wait_time}s: {e}[/yellow]")
-                    time.sleep(wait_time)
+                part_path.unlink(missing_ok=True)
+                # The adapter's Retry only covers failures before the body starts;
+                # a body that breaks off mid-stream gets one more full attempt here
+                if body_started and attempt == 0:
+                    console.print(f"[yellow]Download of {url} was cut off, retrying: {e}[/yellow]")
                     continue
-                else:
-                    console.print(f"[red]Failed to download {url} after {max_retries} attempts: {e}[/red]")
-                    return False
-                    
-            except Exception as e:
-                # Non-retryable errors (404, 403, etc.)
                 console.print(f"[red]Failed to download {url}: {e}[/red]")
                 return False
-        
-        return False
-    
-    def create_pdf(self, images_dir: Path, output_path: Path, title: str, dpi: int = 150):
-        """Create a PDF from downloaded images with pages sized to match each image."""
-        console.print(f"[blue]Creating PDF with custom page sizes (DPI: {dpi})...[/blue]")
-        
-        # Get all image files
-        image_files = []
-        for ext in ['*.jpg', '*.jpeg', '*.png', '*.gif', '*.webp']:
-            image_files.extend(images_dir.glob(ext))
-        
-        # Sort by filename (assuming sequential naming)
-        image_files.sort(key=lambda x: x.name)
-        
-        if not image_files:
-            console.print("[red]No images found for PDF creation[/red]")
-            return
-        
-        from reportlab.platypus import BaseDocTemplate, PageTemplate, Frame
-        from reportlab.lib.units import inch
-        
-        # Create a custom document template that allows different page sizes
-        class CustomDocTemplate(BaseDocTemplate):
-            def __init__(self, filename, **kwargs):
-                BaseDocTemplate.__init__(self, filename, **kwargs)
-                self.page_templates = []
-        
-        try:
-            doc = CustomDocTemplate(str(output_path), title=title, author="Comic Compiler")
-            
-            # We'll build the story manually to handle different page sizes
-            from reportlab.pdfgen import canvas
-            from reportlab.lib.pagesizes import letter
-            
-            # Create the PDF using canvas for full control
-            c = canvas.Canvas(str(output_path))
-            c.setTitle(title)
-            c.setAuthor("Comic Compiler")
-            
-            with Progress() as progress:
-                pdf_task = progress.add_task("Creating PDF...", total=len(image_files))
                 
-                for i, img_path in enumerate(image_files):
-                    try:
-                        # Open image to get dimensions
-                        pil_img = Image.open(img_path)
-                        img_width, img_height = pil_img.size
-                        
-                        # Convert pixels to points (72 points per inch)
-                        # Lower DPI = larger pages, higher DPI = smaller pages
-                        page_width = (img_width * 72) / dpi
-                        page_height = (img_height * 72) / dpi
-                        
-                        # Set the page size for this page
-                        c.setPageSize((page_width, page_height))
-                        
-                        # Update progress with current page info
-                        progress.update(pdf_task, advance=1, description=f"Creating PDF... (Page {i+1}/{len(image_files)})")
-                        
-                        # Draw the image to fill the entire page
-                        c.drawImage(str(img_path), 0, 0, width=page_width, height=page_height)
-                        
-                        # Start a new page (except for the last image)
-                        if i < len(image_files) - 1:
-                            c.showPage()
-                            
-                    except Exception as e:
-                        console.print(f"[red]Error processing {img_path}: {e}[/red]")
-            
-            # Save the PDF
-            c.save()
-            console.print(f"[green]PDF created with custom page sizes: {output_path}[/green]")
-            
-        except Exception as e:
-            console.print(f"[red]Error building custom PDF: {e}[/red]")
-            console.print("[yellow]Falling back to standard PDF format...[/yellow]")
-            # Fallback to the original method
-            self.create_standard_pdf(images_dir, output_path, title)
-    
-    def create_standard_pdf(self, images_dir: Path, output_path: Path, title: str):
-        """Create a standard PDF with fixed page sizes as fallback."""
-        console.print("[blue]Creating standard PDF...[/blue]")
-        
-        # Get all image files
-        image_files = []
-        for ext in ['*.jpg', '*.jpeg', '*.png', '*.gif', '*.webp']:
-            image_files.extend(images_dir.glob(ext))
-        
-        # Sort by filename (assuming sequential naming)
-        image_files.sort(key=lambda x: x.name)
-        
-        if not image_files:
-            console.print("[red]No images found for PDF creation[/red]")
-            return
-        
-        # Use larger margins to ensure images fit
-        margin = 36  # 0.5 inch margin
-        doc = SimpleDocTemplate(
-            str(output_path),
-            pagesize=letter,
-            title=title,
-            author="Comic Compiler",
-            topMargin=margin,
-            bottomMargin=margin,
-            leftMargin=margin,
-            rightMargin=margin
-        )
-        
-        story = []
-        
-        with Progress() as progress:
-            pdf_task = progress.add_task("Creating standard PDF...", total=len(image_files))
-            
-            for i, img_path in enumerate(image_files):
-                try:
-                    # Open image to get dimensions
-                    pil_img = Image.open(img_path)
-                    img_width, img_height = pil_img.size
-                    
-                    # Get page dimensions
-                    page_width, page_height = letter
-                    available_width = page_width - (2 * margin)
-                    available_height = page_height - (2 * margin)
-                    
-                    # Calculate scale to fit within available space with safety buffer
-                    safety_buffer = 0.95  # Use 95% of available space for safety
-                    max_width = available_width * safety_buffer
-                    max_height = available_height * safety_buffer
-                    
-                    scale_x = max_width / img_width
-                    scale_y = max_height / img_height
-                    scale = min(scale_x, scale_y, 1.0)  # Don't upscale
-                    
-                    # Ensure reasonable minimum scale
-                    scale = max(scale, 0.1)
-                    
-                    scaled_width = img_width * scale
-                    scaled_height = img_height * scale
-                    
-                    # Final safety check
-                    if scaled_width > max_width:
-                        scaled_width = max_width
-                        scaled_height = (scaled_width / img_width) * img_height
-                    
-                    if scaled_height > max_height:
-                        scaled_height = max_height
-                        scaled_width = (scaled_height / img_height) * img_width
-                    
-                    # Add image to story
-                    rl_img = RLImage(str(img_path), width=scaled_width, height=scaled_height)
-                    story.append(rl_img)
-                    
-                    # Add page break except for last image
-                    if i < len(image_files) - 1:
-                        story.append(PageBreak())
-                    
-                    # Update progress
-                    progress.update(pdf_task, advance=1, description=f"Creating standard PDF... (Page {i+1}/{len(image_files)})")
-                        
-                except Exception as e:
-                    console.print(f"[red]Error processing {img_path}: {e}[/red]")
-        
-        # Build PDF
-        try:
-            doc.build(story)
-            console.print(f"[green]Standard PDF created: {output_path}[/green]")
-        except Exception as e:
-            console.print(f"[red]Error building standard PDF: {e}[/red]")
-    
-    def create_epub(self, images_dir: Path, output_path: Path, title: str):
-        """Create an EPUB from downloaded images."""
-        console.print("[blue]Creating EPUB...[/blue]")
-        
-        # Get all image files
-        image_files = []
-        for ext in ['*.jpg', '*.jpeg', '*.png', '*.gif', '*.webp']:
-            image_files.extend(images_dir.glob(ext))
-        
-        # Sort by filename
-        image_files.sort(key=lambda x: x.name)
-        
-        if not image_files:
-            console.print("[red]No images found for EPUB creation[/red]")
-            return
-        
-        book = epub.EpubBook()
-        book.set_identifier('comic-compiler-' + str(hash(title)))
-        book.set_title(title)
-        book.set_language('en')
-        book.add_author('Comic Compiler')
-        
-        # Create chapters for images
-        chapters = []
-        cover_set = False
-        
-        with Progress() as progress:
-            epub_task = progress.add_task("Creating EPUB...", total=len(image_files))
-            
-            for i, img_path in enumerate(image_files):
-                try:
-                    # Read and encode image
-                    with open(img_path, 'rb') as img_file:
-                        img_data = img_file.read()
-                    
-                    # Determine image type
-                    img_ext = img_path.suffix.lower()
-                    if img_ext == '.jpg':
-                        img_ext = '.jpeg'
-                    
-                    mime_type = f'image/{img_ext[1:]}'
-                    
-                    # Create image item
-                    img_name = f'image_{i:03d}{img_ext}'
-                    img_item = epub.EpubImage(uid=f'img_{i}', file_name=img_name, 
-                                            media_type=mime_type, content=img_data)
-                    book.add_item(img_item)
-                    
-                    # Use the first image as the cover
-                    if i == 0 and not cover_set:
-                        book.set_cover(img_name, img_data)
-                        cover_set = True
-                    
-                    # Create HTML chapter
-                    chapter_content = f'''<!DOCTYPE html>
-<html>
-<head>
-    <title>Page {i + 1}</title>
-    <style>
-        body {{ margin: 0; padding: 0; text-align: center; }}
-        img {{ max-width: 100%; height: auto; }}
-    </style>
-</head>
-<body>
-    <img src="{img_name}" alt="Page {i + 1}"/>
-</body>
-</html>'''
-                    
-                    chapter = epub.EpubHtml(title=f'Page {i + 1}', 
-                                          file_name=f'page_{i:03d}.xhtml',
-                                          content=chapter_content)
-                    book.add_item(chapter)
-                    chapters.append(chapter)
-                    
-                    # Update progress
-                    progress.update(epub_task, advance=1, description=f"Creating EPUB... (Page {i+1}/{len(image_files)})")
-                    
-                except Exception as e:
-                    console.print(f"[red]Error processing {img_path} for EPUB: {e}[/red]")
+            except Exception as e:
+                # Non-retryable errors (404, 403, etc.) or retries exhausted
+                part_path.unlink(missing_ok=True)
+                console.print(f"[red]Failed to download {url}: {e}[/red]")
+                return False
         
-        # Add navigation
-        book.toc = [(epub.Section('Pages'), chapters)]
-        book.add_item(epub.EpubNcx())
-        book.add_item(epub.EpubNav())
+        with self.seen_lock:
+            self.seen_urls[url] = filepath
+            original_path = self.seen_hashes.setdefault(digest.digest(), filepath)
         
-        # Set spine
-        book.spine = ['nav'] + chapters
+        # Same bytes under a different URL: share the first copy on disk
+        if original_path != filepath and not self.link_existing_image(original_path, filepath):
+            # The first copy is gone (its issue was built without --keep-images)
+            with self.seen_lock:
+                self.seen_hashes[digest.digest()] = filepath
         
-        # Write EPUB
-        epub.write_epub(str(output_path), book)
-        console.print(f"[green]EPUB created: {output_path}[/green]")
+        return True
     
-    def process_comic_series(self, base_url: str, end_number: int, output_format: str = "both", pdf_dpi: int = 150) -> bool:
+    def process_comic_series(self, base_url: str, end_number: int, output_format: str = "both", pdf_dpi: int = 150,
+                             keep_images: bool = False) -> bool:
         """Process a series of comic issues."""
         console.print(Panel(
             Text(f"Comic Compiler\nProcessing: {base_url}\nEnd number: {end_number}\nFormat: {output_format}\nPDF DPI: {pdf_dpi}", justify="center"),
@@ -420,7 +291,7 @@ class ComicCompiler:
         url_pattern = base_url.rstrip('/')
         
         # Find the number pattern in the URL
-        number_match = re.search(r'-(\d+)/?$', url_pattern)
+        number_match = _ISSUE_NUMBER_RE.search(url_pattern)
         if not number_match:
             console.print("[red]Could not find number pattern in URL[/red]")
             return False
@@ -436,79 +307,89 @@ class ComicCompiler:
         comic_title = None
         total_files_created = 0
         
-        for issue_num in range(start_number, end_number + 1):
-            # Format number with leading zeros if original had them
-            formatted_num = str(issue_num).zfill(number_length)
-            issue_url = f"{base_pattern}{formatted_num}{url_suffix}"
-            
-            console.print(f"\n[cyan]Processing issue {issue_num}...[/cyan]")
-            
-            title, images = self.get_comic_images(issue_url)
-            if not comic_title:
-                # Use the first issue's title as the series title
-                comic_title = re.sub(r'#?\d+.*$', '', title).strip()
+        # Format numbers with leading zeros if original had them
+        issue_numbers = range(start_number, end_number + 1)
+        issue_urls = [f"{base_pattern}{str(issue_num).zfill(number_length)}{url_suffix}" for issue_num in issue_numbers]
+        
+        # PDF/EPUB builds are CPU-bound, so they run in separate processes
+        build_jobs = {}
+        # Spawned workers don't inherit the parent's session, lock or download threads
+        with ProcessPoolExecutor(max_workers=os.cpu_count(),
+                                 mp_context=multiprocessing.get_context("spawn")) as build_pool:
+            for issue_num, (title, images) in zip(issue_numbers, self.fetch_issue_pages(issue_urls)):
+                console.print(f"\n[cyan]Processing issue {issue_num}...[/cyan]")
+                
                 if not comic_title:
-                    comic_title = title
-            
-            if not images:
-                console.print(f"[yellow]No images found for issue {issue_num}, skipping...[/yellow]")
-                continue
-            
-            # Create output directory for this comic series
-            safe_title = re.sub(r'[^\w\s-]', '', comic_title).strip()
-            safe_title = re.sub(r'[-\s]+', '-', safe_title)
-            comic_dir = self.output_dir / safe_title
-            issue_dir = comic_dir / f"issue-{issue_num:02d}"
-            images_dir = issue_dir / 'images'
-            images_dir.mkdir(parents=True, exist_ok=True)
-            
-            # Download images for this issue
-            console.print(f"[blue]Downloading {len(images)} images for issue {issue_num}...[/blue]")
-            
-            downloaded_count = 0
-            with Progress() as progress:
-                download_task = progress.add_task(f"Downloading issue {issue_num}...", total=len(images))
+                    # Use the first issue's title as the series title
+                    comic_title = _ISSUE_SUFFIX_RE.sub('', title).strip()
+                    if not comic_title:
+                        comic_title = title
                 
-                for i, img_url in enumerate(images):
-                    # Generate filename
-                    img_ext = Path(urlparse(img_url).path).suffix or '.jpg'
-                    img_filename = f"{i+1:04d}{img_ext}"
-                    img_path = images_dir / img_filename
-                    
-                    if self.download_image(img_url, img_path):
-                        downloaded_count += 1
+                if not images:
+                    console.print(f"[yellow]No images found for issue {issue_num}, skipping...[/yellow]")
+                    continue
+                
+                # Create output directory for this comic series
+                safe_title = _UNSAFE_CHARS_RE.sub('', comic_title).strip()
+                safe_title = _SEPARATORS_RE.sub('-', safe_title)
+                comic_dir = self.output_dir / safe_title
+                issue_dir = comic_dir / f"issue-{issue_num:02d}"
+                images_dir = issue_dir / 'images'
+                images_dir.mkdir(parents=True, exist_ok=True)
+                
+                # Download images for this issue
+                console.print(f"[blue]Downloading {len(images)} images for issue {issue_num}...[/blue]")
+                
+                downloaded_count = 0
+                with Progress() as progress:
+                    download_task = progress.add_task(f"Downloading issue {issue_num}...", total=len(images))
                     
-                    progress.update(download_task, advance=1)
-                    time.sleep(0.5)  # Rate limiting
-            
-            if downloaded_count == 0:
-                console.print(f"[red]No images downloaded for issue {issue_num}, skipping...[/red]")
-                continue
-            
-            console.print(f"[green]Downloaded {downloaded_count}/{len(images)} images for issue {issue_num}[/green]")
-            
-            # Create PDF and/or EPUB for this issue
-            issue_title = f"{comic_title} #{issue_num:02d}"
-            pdf_path = issue_dir / f"{safe_title}-{issue_num:02d}.pdf"
-            epub_path = issue_dir / f"{safe_title}-{issue_num:02d}.epub"
-            
-            created_files = []
-            
-            if output_format in ["both", "pdf"]:
-                self.create_pdf(images_dir, pdf_path, issue_title, pdf_dpi)
-                created_files.append(f"PDF: {pdf_path.name}")
-                total_files_created += 1
-            
-            if output_format in ["both", "epub"]:
-                self.create_epub(images_dir, epub_path, issue_title)
-                created_files.append(f"EPUB: {epub_path.name}")
-                total_files_created += 1
-            
-            files_info = ", ".join(created_files)
-            console.print(f"[green]Created {files_info} for issue {issue_num}[/green]")
+                    with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                        futures = []
+                        for i, img_url in enumerate(images):
+                            # Generate filename
+                            img_ext = Path(urlparse(img_url).path).suffix or '.jpg'
+                            img_filename = f"{i+1:04d}{img_ext}"
+                            img_path = images_dir / img_filename
+                            
+                            # Rate limiting is handled globally inside download_image
+                            futures.append(executor.submit(self.download_image, img_url, img_path))
+                        
+                        for future in as_completed(futures):
+                            if future.result():
+                                downloaded_count += 1
+                            progress.update(download_task, advance=1)
+                
+                if downloaded_count == 0:
+                    console.print(f"[red]No images downloaded for issue {issue_num}, skipping...[/red]")
+                    continue
+                
+                console.print(f"[green]Downloaded {downloaded_count}/{len(images)} images for issue {issue_num}[/green]")
+                
+                # Create PDF and/or EPUB for this issue
+                issue_title = f"{comic_title} #{issue_num:02d}"
+                pdf_path = issue_dir / f"{safe_title}-{issue_num:02d}.pdf"
+                epub_path = issue_dir / f"{safe_title}-{issue_num:02d}.epub"
+                
+                # Build outputs in a worker process while the next issue downloads
+                build_future = build_pool.submit(build_issue_outputs, images_dir, pdf_path, epub_path,
+                                                 issue_title, output_format, pdf_dpi, keep_images)
+                build_jobs[build_future] = issue_num
             
-            # Be nice to the server between issues
-            time.sleep(1)
+            for future in as_completed(build_jobs):
+                try:
+                    created_files, build_log = future.result()
+                except Exception as e:
+                    console.print(f"[red]Failed to build outputs for issue {build_jobs[future]}: {e}[/red]")
+                    continue
+                console.print(Text.from_ansi(build_log), end="")
+                total_files_created += len(created_files)
+
+                if created_files:
+                    files_info = ", ".join(created_files)
+                    console.print(f"[green]Created {files_info} for issue {build_jobs[future]}[/green]")
+                else:
+                    console.print(f"[red]No files created for issue {build_jobs[future]}[/red]")
         
         # Final summary
         if total_files_created > 0:
@@ -526,6 +407,333 @@ class ComicCompiler:
             return False
 
 
+def _list_images(images_dir: Path) -> list[Path]:
+    """Return the image files in images_dir sorted by filename, using a single directory scan."""
+    with os.scandir(images_dir) as entries:
+        image_files = [Path(entry.path) for entry in entries
+                       if entry.is_file() and os.path.splitext(entry.name)[1].lower() in _IMAGE_EXTENSIONS]
+    
+    image_files.sort(key=lambda x: x.name)
+    return image_files
+
+def _drop_page_cache(paths: list[Path]):
+    """Advise the kernel that the given files' cached pages can be evicted (no-op where unsupported)."""
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+            finally:
+                os.close(fd)
+        except OSError:
+            pass
+
+def build_issue_outputs(images_dir: Path, pdf_path: Path, epub_path: Path, title: str,
+                        output_format: str = "both", dpi: int = 150, keep_images: bool = False) -> tuple[list[str], str]:
+    """Create the requested PDF and/or EPUB for one issue; return the files created and the build log."""
+    # Workers don't own the terminal: their messages are handed back for the parent to
+    # print, so they can't tear through the next issue's live download bar
+    with console.capture() as capture:
+        created_files = []
+        all_written = True
+        
+        if output_format in ["both", "pdf"]:
+            if create_pdf(images_dir, pdf_path, title, dpi):
+                created_files.append(f"PDF: {pdf_path.name}")
+            else:
+                all_written = False
+        
+        if output_format in ["both", "epub"]:
+            if create_epub(images_dir, epub_path, title):
+                created_files.append(f"EPUB: {epub_path.name}")
+            else:
+                all_written = False
+        
+        if keep_images or not all_written:
+            if not keep_images:
+                console.print(f"[yellow]Keeping images in {images_dir} because not every output was built; rerun to retry without downloading them again[/yellow]")
+            # The pages won't be read again, so don't let them crowd the page cache on long series
+            _drop_page_cache(_list_images(images_dir))
+        else:
+            # Deleting the pages right after the build frees them before most have been
+            # written back, so they never cost disk I/O at all
+            shutil.rmtree(images_dir, ignore_errors=True)
+    
+    return created_files, capture.get()
+
+def create_pdf(images_dir: Path, output_path: Path, title: str, dpi: int = 150) -> bool:
+    """Create a PDF from downloaded images with pages sized to match each image; return True if every page made it in."""
+    console.print(f"[blue]Creating PDF with custom page sizes (DPI: {dpi})...[/blue]")
+    
+    # Get all image files, sorted by filename (assuming sequential naming)
+    image_files = _list_images(images_dir)
+    
+    if not image_files:
+        console.print("[red]No images found for PDF creation[/red]")
+        return False
+    
+    from reportlab.platypus import BaseDocTemplate, PageTemplate, Frame
+    from reportlab.lib.units import inch
+    
+    # Create a custom document template that allows different page sizes
+    class CustomDocTemplate(BaseDocTemplate):
+        def __init__(self, filename, **kwargs):
+            BaseDocTemplate.__init__(self, filename, **kwargs)
+            self.page_templates = []
+    
+    try:
+        doc = CustomDocTemplate(str(output_path), title=title, author="Comic Compiler")
+        
+        # We'll build the story manually to handle different page sizes
+        from reportlab.pdfgen import canvas
+        from reportlab.lib.pagesizes import letter
+        
+        # Create the PDF using canvas for full control
+        c = canvas.Canvas(str(output_path))
+        c.setTitle(title)
+        c.setAuthor("Comic Compiler")
+        
+        failed_pages = 0
+        for i, img_path in enumerate(image_files):
+            try:
+                # Probe the dimensions without decoding; JPEGs are only header-scanned
+                rl_img = RLImage(str(img_path))
+                img_width, img_height = rl_img.imageWidth, rl_img.imageHeight
+                
+                # Convert pixels to points (72 points per inch)
+                # Lower DPI = larger pages, higher DPI = smaller pages
+                page_width = (img_width * 72) / dpi
+                page_height = (img_height * 72) / dpi
+                
+                # Set the page size for this page
+                c.setPageSize((page_width, page_height))
+                
+                # Draw the image to fill the entire page. Passing the path lets ReportLab
+                # name the image by filename; an ImageReader would be fully decoded just
+                # to hash its pixels, even for JPEGs that are embedded verbatim.
+                c.drawImage(str(img_path), 0, 0, width=page_width, height=page_height)
+                
+                # Start a new page (except for the last image)
+                if i < len(image_files) - 1:
+                    c.showPage()
+                    
+            except Exception as e:
+                failed_pages += 1
+                console.print(f"[red]Error processing {img_path}: {e}[/red]")
+        
+        # Save the PDF
+        c.save()
+        console.print(f"[green]PDF created with custom page sizes: {output_path}[/green]")
+        
+    except Exception as e:
+        console.print(f"[red]Error building custom PDF: {e}[/red]")
+        console.print("[yellow]Falling back to standard PDF format...[/yellow]")
+        # Fallback to the original method
+        return create_standard_pdf(images_dir, output_path, title)
+    
+    return failed_pages == 0
+
+def create_standard_pdf(images_dir: Path, output_path: Path, title: str) -> bool:
+    """Create a standard PDF with fixed page sizes as fallback; return True if every page made it in."""
+    console.print("[blue]Creating standard PDF...[/blue]")
+    
+    # Get all image files, sorted by filename (assuming sequential naming)
+    image_files = _list_images(images_dir)
+    
+    if not image_files:
+        console.print("[red]No images found for PDF creation[/red]")
+        return False
+    
+    # Use larger margins to ensure images fit
+    margin = 36  # 0.5 inch margin
+    doc = SimpleDocTemplate(
+        str(output_path),
+        pagesize=letter,
+        title=title,
+        author="Comic Compiler",
+        topMargin=margin,
+        bottomMargin=margin,
+        leftMargin=margin,
+        rightMargin=margin
+    )
+    
+    story = []
+    failed_pages = 0
+    
+    for i, img_path in enumerate(image_files):
+        try:
+            # Let ReportLab probe the dimensions; JPEGs are only header-scanned here
+            # and later embedded without being decoded
+            rl_img = RLImage(str(img_path))
+            img_width, img_height = rl_img.imageWidth, rl_img.imageHeight
+            
+            # Get page dimensions
+            page_width, page_height = letter
+            available_width = page_width - (2 * margin)
+            available_height = page_height - (2 * margin)
+            
+            # Calculate scale to fit within available space with safety buffer
+            safety_buffer = 0.95  # Use 95% of available space for safety
+            max_width = available_width * safety_buffer
+            max_height = available_height * safety_buffer
+            
+            scale_x = max_width / img_width
+            scale_y = max_height / img_height
+            scale = min(scale_x, scale_y, 1.0)  # Don't upscale
+            
+            # Ensure reasonable minimum scale
+            scale = max(scale, 0.1)
+            
+            scaled_width = img_width * scale
+            scaled_height = img_height * scale
+            
+            # Final safety check
+            if scaled_width > max_width:
+                scaled_width = max_width
+                scaled_height = (scaled_width / img_width) * img_height
+            
+            if scaled_height > max_height:
+                scaled_height = max_height
+                scaled_width = (scaled_height / img_height) * img_width
+            
+            # Add image to story
+            rl_img.drawWidth = scaled_width
+            rl_img.drawHeight = scaled_height
+            story.append(rl_img)
+            
+            # Add page break except for last image
+            if i < len(image_files) - 1:
+                story.append(PageBreak())
+            
+        except Exception as e:
+            failed_pages += 1
+            console.print(f"[red]Error processing {img_path}: {e}[/red]")
+    
+    # Build PDF
+    try:
+        doc.build(story)
+        console.print(f"[green]Standard PDF created: {output_path}[/green]")
+    except Exception as e:
+        console.print(f"[red]Error building standard PDF: {e}[/red]")
+        return False
+    
+    return failed_pages == 0
+
+class ComicEpubWriter(epub.EpubWriter):
+    """EPUB writer that copies page images from disk as-is instead of deflating already-compressed data."""
+
+    def _write_items(self):
+        deflate_writestr = self.out.writestr
+        written = set()
+        
+        def writestr(name, data, compress_type=None, compresslevel=None):
+            if isinstance(data, Path):
+                # Image items carry their path: each page is opened only while its entry is
+                # written, and the cover shares page 1's entry instead of storing it twice
+                if name not in written:
+                    self.out.write(data, name, compress_type=zipfile.ZIP_STORED)
+                    written.add(name)
+            else:
+                deflate_writestr(name, data, compress_type=compress_type, compresslevel=compresslevel)
+        
+        self.out.writestr = writestr
+        try:
+            super()._write_items()
+        finally:
+            del self.out.writestr
+
+def create_epub(images_dir: Path, output_path: Path, title: str) -> bool:
+    """Create an EPUB from downloaded images; return True if every page made it in."""
+    console.print("[blue]Creating EPUB...[/blue]")
+    
+    # Get all image files, sorted by filename (assuming sequential naming)
+    image_files = _list_images(images_dir)
+    
+    if not image_files:
+        console.print("[red]No images found for EPUB creation[/red]")
+        return False
+    
+    book = epub.EpubBook()
+    # Stable across runs (unlike hash()) so readers keep bookmarks when an issue is rebuilt
+    book.set_identifier('comic-compiler-' + hashlib.blake2b(title.encode('utf-8'), digest_size=8).hexdigest())
+    book.set_title(title)
+    book.set_language('en')
+    book.add_author('Comic Compiler')
+    
+    # Create chapters for images
+    chapters = []
+    cover_set = False
+    failed_pages = 0
+    
+    for i, img_path in enumerate(image_files):
+        try:
+            # Determine image type
+            img_ext = img_path.suffix.lower()
+            if img_ext == '.jpg':
+                img_ext = '.jpeg'
+            
+            mime_type = f'image/{img_ext[1:]}'
+            
+            # Create image item
+            img_name = f'image_{i:03d}{img_ext}'
+            img_item = epub.EpubImage(uid=f'img_{i}', file_name=img_name, 
+                                    media_type=mime_type, content=img_path)
+            book.add_item(img_item)
+            
+            # Use the first image as the cover
+            if i == 0 and not cover_set:
+                book.set_cover(img_name, img_path)
+                cover_set = True
+            
+            # Create HTML chapter
+            chapter_content = f'''<!DOCTYPE html>
+<html>
+<head>
+    <title>Page {i + 1}</title>
+    <style>
+        body {{ margin: 0; padding: 0; text-align: center; }}
+        img {{ max-width: 100%; height: auto; }}
+    </style>
+</head>
+<body>
+    <img src="{img_name}" alt="Page {i + 1}"/>
+</body>
+</html>'''
+            
+            chapter = epub.EpubHtml(title=f'Page {i + 1}', 
+                                  file_name=f'page_{i:03d}.xhtml',
+                                  content=chapter_content)
+            book.add_item(chapter)
+            chapters.append(chapter)
+            
+        except Exception as e:
+            failed_pages += 1
+            console.print(f"[red]Error processing {img_path} for EPUB: {e}[/red]")
+    
+    # Add navigation
+    book.toc = [(epub.Section('Pages'), chapters)]
+    book.add_item(epub.EpubNcx())
+    book.add_item(epub.EpubNav())
+    
+    # Set spine
+    book.spine = ['nav'] + chapters
+    
+    # Write EPUB
+    writer = ComicEpubWriter(str(output_path), book)
+    try:
+        writer.process()
+        writer.write()
+    except OSError as e:
+        console.print(f"[red]Error writing EPUB: {e}[/red]")
+        return False
+    console.print(f"[green]EPUB created: {output_path}[/green]")
+    
+    return failed_pages == 0
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Download comic pages and convert them to PDF and EPUB formats",
@@ -535,6 +743,8 @@ Examples:
   %(prog)s "https://grabber.zone/comics/sonic-idw/sonic-the-hedgehog-05/" 15 ~/Comics --format pdf
   %(prog)s "https://grabber.zone/comics/sonic-idw/sonic-the-hedgehog-01/" 3 ./output --format epub
   %(prog)s "https://grabber.zone/comics/sonic-idw/sonic-the-hedgehog-01/" 5 ./output --dpi 200
+  %(prog)s "https://grabber.zone/comics/sonic-idw/sonic-the-hedgehog-01/" 5 ./output --workers 4 --rate 1
+  %(prog)s "https://grabber.zone/comics/sonic-idw/sonic-the-hedgehog-01/" 5 ./output --keep-images
         """,
         formatter_class=argparse.RawDescriptionHelpFormatter
     )
@@ -546,6 +756,12 @@ Examples:
                        default='both', help='Output format (default: both)')
     parser.add_argument('--dpi', type=int, default=150,
                        help='DPI for PDF page sizing - lower values create larger pages (default: 150)')
+    parser.add_argument('--workers', '-w', type=int, default=8,
+                       help='Number of parallel image downloads per issue (default: 8)')
+    parser.add_argument('--rate', type=float, default=2.0,
+                       help='Maximum requests per second sent to the site (default: 2)')
+    parser.add_argument('--keep-images', action='store_true',
+                       help='Keep the downloaded page images after the PDF/EPUB is built')
     
     args = parser.parse_args()
     
@@ -562,11 +778,20 @@ Examples:
         console.print("[red]Error: DPI must be between 50 and 600[/red]")
         sys.exit(1)
     
+    if args.workers < 1 or args.workers > 32:
+        console.print("[red]Error: workers must be between 1 and 32[/red]")
+        sys.exit(1)
+    
+    if not (0 < args.rate <= 10):
+        console.print("[red]Error: rate must be greater than 0 and at most 10 requests per second[/red]")
+        sys.exit(1)
+    
     # Create compiler and process
-    compiler = ComicCompiler(args.output_dir)
+    compiler = ComicCompiler(args.output_dir, max_workers=args.workers, requests_per_second=args.rate)
     
     try:
-        success = compiler.process_comic_series(args.base_url, args.end_number, args.format, args.dpi)
+        success = compiler.process_comic_series(args.base_url, args.end_number, args.format, args.dpi,
+                                                args.keep_images)
         sys.exit(0 if success else 1)
     except KeyboardInterrupt:
         console.print("\n[yellow]Operation cancelled by user[/yellow]")